@@ -13,6 +13,7 @@ from __future__ import annotations
 import json
 import dataclasses
 import types
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Literal, Iterable, Union, Callable, Optional, TYPE_CHECKING
 
 from searx import locales
@@ -210,18 +211,28 @@ class EngineTraitsMap(Dict[str, EngineTraits]):
         return obj
 
     @classmethod
-    def fetch_traits(cls, log: Callable) -> 'EngineTraitsMap':
-        from searx import engines  # pylint: disable=cyclic-import, import-outside-toplevel
+    def fetch_traits(cls, log: Callable, max_workers: int = 16) -> 'EngineTraitsMap':
+        """Fetch the traits of all engines, up to ``max_workers`` engines are
+        fetched in parallel.  The timeout set by
+        :py:obj:`searx.network.set_timeout_for_thread` in the calling thread is
+        also used by the worker threads."""
+        # pylint: disable=cyclic-import, import-outside-toplevel
+        from searx import engines, network
 
         names = list(engines.engines)
         names.sort()
         obj = cls()
 
-        for engine_name in names:
-            engine = engines.engines[engine_name]
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            initializer=network.set_timeout_for_thread,
+            initargs=(getattr(network.THREADLOCAL, 'timeout', None),),
+        ) as executor:
+            fetched = executor.map(lambda name: EngineTraits.fetch_traits(engines.engines[name]), names)
 
-            traits = EngineTraits.fetch_traits(engine)
-            if traits is not None:
+            for engine_name, traits in zip(names, fetched):
+                if traits is None:
+                    continue
                 log("%-20s: SearXNG languages --> %s " % (engine_name, len(traits.languages)))
                 log("%-20s: SearXNG regions   --> %s" % (engine_name, len(traits.regions)))
                 obj[engine_name] = traits
@@ -234,17 +245,18 @@ class EngineTraitsMap(Dict[str, EngineTraits]):
         :param engine: engine instance build by :py:func:`searx.engines.load_engine`
         """
 
-        engine_traits = EngineTraits(data_type='traits_v1')
-        if engine.name in self.keys():
-            engine_traits = self[engine.name]
+        engine_traits = self.get(engine.name)
 
-        elif engine.engine in self.keys():
+        if engine_traits is None:
             # The key of the dictionary traits_map is the *engine name*
             # configured in settings.xml.  When multiple engines are configured
             # in settings.yml to use the same origin engine (python module)
             # these additional engines can use the languages from the origin
             # engine.  For this use the configured ``engine: ...`` from
             # settings.yml
-            engine_traits = self[engine.engine]
+            engine_traits = self.get(engine.engine)
+
+        if engine_traits is None:
+            engine_traits = EngineTraits(data_type='traits_v1')
 
         engine_traits.set_traits(engine)
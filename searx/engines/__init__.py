@@ -11,7 +11,7 @@ usage::
 from __future__ import annotations
 
 import sys
-import copy
+import functools
 from os.path import realpath, dirname
 
 from typing import TYPE_CHECKING, Dict
@@ -23,6 +23,7 @@ from searx.utils import load_module
 
 if TYPE_CHECKING:
     from searx.enginelib import Engine
+    from searx.enginelib.traits import EngineTraitsMap
 
 logger = logger.getChild('engines')
 ENGINE_DIR = dirname(realpath(__file__))
@@ -88,7 +89,8 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
     3. update namespace with values from ``engine_data``
 
     If engine *is active*, return namespace of the engine, otherwise return
-    ``None``.
+    ``None``.  The module of an engine that is set ``inactive: true`` in the
+    ``engine_data`` is not loaded.
 
     This function also returns ``None`` if initialization of the namespace fails
     for one of the following reasons:
@@ -118,6 +120,12 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
     if module_name is None:
         logger.error('The "engine" field is missing for the engine named "{}"'.format(engine_name))
         return None
+
+    if engine_data.get('inactive') is True:
+        # don't load the module of an engine that is never used, see
+        # is_engine_active()
+        return None
+
     try:
         engine = load_module(module_name + '.py', ENGINE_DIR)
     except (SyntaxError, KeyboardInterrupt, SystemExit, SystemError, ImportError, RuntimeError):
@@ -131,12 +139,7 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
     update_engine_attributes(engine, engine_data)
     update_attributes_for_tor(engine)
 
-    # avoid cyclic imports
-    # pylint: disable=import-outside-toplevel
-    from searx.enginelib.traits import EngineTraitsMap
-
-    trait_map = EngineTraitsMap.from_data()
-    trait_map.set_traits(engine)
+    get_engine_traits_map().set_traits(engine)
 
     if not is_engine_active(engine):
         return None
@@ -144,18 +147,37 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
     if is_missing_required_attributes(engine):
         return None
 
-    set_loggers(engine, engine_name)
+    # the loggers of the other modules are set once in load_engines()
+    engine.logger = logger.getChild(engine_name)  # type: ignore
 
-    if not any(cat in settings['categories_as_tabs'] for cat in engine.categories):
+    if settings['categories_as_tabs'].keys().isdisjoint(engine.categories):
         engine.categories.append(DEFAULT_CATEGORY)
 
     return engine
 
 
+@functools.lru_cache(maxsize=1)
+def get_engine_traits_map() -> EngineTraitsMap:
+    """Returns the :py:obj:`EngineTraitsMap <searx.enginelib.traits.EngineTraitsMap>`
+    built from :py:obj:`searx.data.ENGINE_TRAITS`.  The map is built only once and
+    shared by all engines, :py:obj:`EngineTraitsMap.set_traits
+    <searx.enginelib.traits.EngineTraitsMap.set_traits>` sets a copy of the traits
+    in the engine's namespace."""
+    # avoid cyclic imports
+    # pylint: disable=import-outside-toplevel
+    from searx.enginelib.traits import EngineTraitsMap
+
+    return EngineTraitsMap.from_data()
+
+
 def set_loggers(engine, engine_name):
     # set the logger for engine
     engine.logger = logger.getChild(engine_name)
-    # the engine may have load some other engines
+    set_module_loggers()
+
+
+def set_module_loggers():
+    # the engines may have load some other engines
     # may sure the logger is initialized
     # use sys.modules.copy() to avoid "RuntimeError: dictionary changed size during iteration"
     # see https://github.com/python/cpython/issues/89516
@@ -178,15 +200,18 @@ def update_engine_attributes(engine: Engine | types.ModuleType, engine_data):
             if isinstance(param_value, str):
                 param_value = list(map(str.strip, param_value.split(',')))
             engine.categories = param_value  # type: ignore
-        elif hasattr(engine, 'about') and param_name == 'about':
+        elif param_name == 'about' and hasattr(engine, 'about'):
             engine.about = {**engine.about, **engine_data['about']}  # type: ignore
         else:
             setattr(engine, param_name, param_value)
 
-    # set default attributes
+    # set default attributes, the mutable values in ENGINE_DEFAULT_ARGS are flat
+    # lists and dicts, a shallow copy is enough
     for arg_name, arg_value in ENGINE_DEFAULT_ARGS.items():
         if not hasattr(engine, arg_name):
-            setattr(engine, arg_name, copy.deepcopy(arg_value))
+            if isinstance(arg_value, (list, dict)):
+                arg_value = arg_value.copy()
+            setattr(engine, arg_name, arg_value)
 
 
 def update_attributes_for_tor(engine: Engine | types.ModuleType):
@@ -201,8 +226,8 @@ def is_missing_required_attributes(engine):
 
     """
     missing = False
-    for engine_attr in dir(engine):
-        if not engine_attr.startswith('_') and getattr(engine, engine_attr) is None:
+    for engine_attr, attr_value in vars(engine).items():
+        if not engine_attr.startswith('_') and attr_value is None:
             logger.error('Missing engine config attribute: "{0}.{1}"'.format(engine.name, engine_attr))
             missing = True
     return missing
@@ -250,4 +275,5 @@ def load_engines(engine_list):
         engine = load_engine(engine_data)
         if engine:
             register_engine(engine)
+    set_module_loggers()
     return engines
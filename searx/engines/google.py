@@ -16,12 +16,12 @@ from typing import TYPE_CHECKING
 import re
 from urllib.parse import urlencode
 from lxml import html
+from lxml.etree import XPath
 import babel
-import babel.core
 import babel.languages
 
 from searx.utils import extract_text, eval_xpath, eval_xpath_list, eval_xpath_getindex
-from searx.locales import language_tag, region_tag, get_official_locales
+from searx.locales import language_tag, region_tag, get_locale, get_official_locales
 from searx.network import get  # see https://github.com/searxng/searxng/issues/762
 from searx.exceptions import SearxEngineCaptchaException
 from searx.enginelib.traits import EngineTraits
@@ -59,14 +59,19 @@ filter_mapping = {0: 'off', 1: 'medium', 2: 'high'}
 # specific xpath variables
 # ------------------------
 
-results_xpath = './/div[contains(@jscontroller, "SC7lYd")]'
-title_xpath = './/a/h3[1]'
-href_xpath = './/a[h3]/@href'
-content_xpath = './/div[@data-sncf="1"]'
+results_xpath = XPath('.//div[contains(@jscontroller, "SC7lYd")]')
+title_xpath = XPath('.//a/h3[1]')
+href_xpath = XPath('.//a[h3]/@href')
+content_xpath = XPath('.//div[@data-sncf="1"]')
+thumbnail_xpath = XPath('.//img/@src')
+thumbnail_id_xpath = XPath('.//img/@id')
+answer_xpath = XPath('//div[contains(@class, "LGOjhe")]')
+answer_text_xpath = XPath('normalize-space()')
+answer_url_xpath = XPath('../..//a/@href')
 
 # Suggestions are links placed in a *card-section*, we extract only the text
 # from the links not the links itself.
-suggestion_xpath = '//div[contains(@class, "EIaa9b")]//a'
+suggestion_xpath = XPath('//div[contains(@class, "EIaa9b")]//a')
 
 # UI_ASYNC = 'use_ac:true,_fmt:html' # returns a HTTP 500 when user search for
 #                                    # celebrities like '!google natasha allegri'
@@ -135,16 +140,19 @@ def get_google_info(params, eng_traits):
         'country': None,
         'subdomain': None,
         'params': {},
-        'headers': {},
-        'cookies': {},
+        'headers': {
+            'Accept': '*/*',
+        },
+        'cookies': {
+            # - https://github.com/searxng/searxng/pull/1679#issuecomment-1235432746
+            # - https://github.com/searxng/searxng/issues/1555
+            'CONSENT': "YES+",
+        },
         'locale': None,
     }
 
     sxng_locale = params.get('searxng_locale', 'all')
-    try:
-        locale = babel.Locale.parse(sxng_locale, sep='-')
-    except babel.core.UnknownLocaleError:
-        locale = None
+    locale = get_locale(sxng_locale)
 
     eng_lang = eng_traits.get_language(sxng_locale, 'lang_en')
     lang_code = eng_lang.split('_')[-1]  # lang_zh-TW --> zh-TW / lang_en --> en
@@ -241,21 +249,12 @@ def get_google_info(params, eng_traits):
     # HINT: seems to have no effect (tested in google WEB & Images)
     # ret_val['params']['num'] = 20
 
-    # HTTP headers
-
-    ret_val['headers']['Accept'] = '*/*'
-
-    # Cookies
-
-    # - https://github.com/searxng/searxng/pull/1679#issuecomment-1235432746
-    # - https://github.com/searxng/searxng/issues/1555
-    ret_val['cookies']['CONSENT'] = "YES+"
-
     return ret_val
 
 
 def detect_google_sorry(resp):
-    if resp.url.host == 'sorry.google.com' or resp.url.path.startswith('/sorry'):
+    resp_url = resp.url
+    if resp_url.host == 'sorry.google.com' or resp_url.path.startswith('/sorry'):
         raise SearxEngineCaptchaException()
 
 
@@ -266,38 +265,31 @@ def request(query, params):
     google_info = get_google_info(params, traits)
 
     # https://www.google.de/search?q=corona&hl=de&lr=lang_de&start=0&tbs=qdr%3Ad&safe=medium
-    query_url = (
-        'https://'
-        + google_info['subdomain']
-        + '/search'
-        + "?"
-        + urlencode(
-            {
-                'q': query,
-                **google_info['params'],
-                'filter': '0',
-                'start': offset,
-                # 'vet': '12ahUKEwik3ZbIzfn7AhXMX_EDHbUDBh0QxK8CegQIARAC..i',
-                # 'ved': '2ahUKEwik3ZbIzfn7AhXMX_EDHbUDBh0Q_skCegQIARAG',
-                # 'cs' : 1,
-                # 'sa': 'N',
-                # 'yv': 3,
-                # 'prmd': 'vin',
-                # 'ei': 'GASaY6TxOcy_xc8PtYeY6AE',
-                # 'sa': 'N',
-                # 'sstk': 'AcOHfVkD7sWCSAheZi-0tx_09XDO55gTWY0JNq3_V26cNN-c8lfD45aZYPI8s_Bqp8s57AHz5pxchDtAGCA_cikAWSjy9kw3kgg'
-                # formally known as use_mobile_ui
-                'asearch': 'arc',
-                'async': UI_ASYNC,
-            }
-        )
-    )
+    args = {
+        'q': query,
+        **google_info['params'],
+        'filter': '0',
+        'start': offset,
+        # 'vet': '12ahUKEwik3ZbIzfn7AhXMX_EDHbUDBh0QxK8CegQIARAC..i',
+        # 'ved': '2ahUKEwik3ZbIzfn7AhXMX_EDHbUDBh0Q_skCegQIARAG',
+        # 'cs' : 1,
+        # 'sa': 'N',
+        # 'yv': 3,
+        # 'prmd': 'vin',
+        # 'ei': 'GASaY6TxOcy_xc8PtYeY6AE',
+        # 'sa': 'N',
+        # 'sstk': 'AcOHfVkD7sWCSAheZi-0tx_09XDO55gTWY0JNq3_V26cNN-c8lfD45aZYPI8s_Bqp8s57AHz5pxchDtAGCA_cikAWSjy9kw3kgg'
+        # formally known as use_mobile_ui
+        'asearch': 'arc',
+        'async': UI_ASYNC,
+    }
 
-    if params['time_range'] in time_range_dict:
-        query_url += '&' + urlencode({'tbs': 'qdr:' + time_range_dict[params['time_range']]})
+    time_range = time_range_dict.get(params['time_range'])
+    if time_range:
+        args['tbs'] = 'qdr:' + time_range
     if params['safesearch']:
-        query_url += '&' + urlencode({'safe': filter_mapping[params['safesearch']]})
-    params['url'] = query_url
+        args['safe'] = filter_mapping[params['safesearch']]
+    params['url'] = 'https://' + google_info['subdomain'] + '/search?' + urlencode(args)
 
     params['cookies'] = google_info['cookies']
     params['headers'].update(google_info['headers'])
@@ -332,12 +324,12 @@ def response(resp):
     data_image_map = _parse_data_images(dom)
 
     # results --> answer
-    answer_list = eval_xpath(dom, '//div[contains(@class, "LGOjhe")]')
+    answer_list = eval_xpath(dom, answer_xpath)
     for item in answer_list:
         results.append(
             {
-                'answer': item.xpath("normalize-space()"),
-                'url': (eval_xpath(item, '../..//a/@href') + [None])[0],
+                'answer': eval_xpath(item, answer_text_xpath),
+                'url': eval_xpath_getindex(item, answer_url_xpath, 0, default=None),
             }
         )
 
@@ -365,11 +357,11 @@ def response(resp):
                 logger.debug('ignoring item from the result_xpath list: missing content of title "%s"', title)
                 continue
 
-            thumbnail = content_nodes[0].xpath('.//img/@src')
+            thumbnail = eval_xpath(content_nodes[0], thumbnail_xpath)
             if thumbnail:
                 thumbnail = thumbnail[0]
                 if thumbnail.startswith('data:image'):
-                    img_id = content_nodes[0].xpath('.//img/@id')
+                    img_id = eval_xpath(content_nodes[0], thumbnail_id_xpath)
                     if img_id:
                         thumbnail = data_image_map.get(img_id[0])
             else:
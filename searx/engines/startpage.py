@@ -80,21 +80,21 @@ Startpage's category (for Web-search, News, Videos, ..) is set by
 """
 # pylint: disable=too-many-statements
 
-from typing import TYPE_CHECKING
-from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+import functools
 import re
-from unicodedata import normalize, combining
+import threading
+from unicodedata import normalize
 from time import time
 from datetime import datetime, timedelta
 
-import dateutil.parser
 import lxml.html
+from lxml.etree import XPath
 import babel.localedata
 
 from searx.utils import extract_text, eval_xpath, gen_useragent
 from searx.network import get  # see https://github.com/searxng/searxng/issues/762
 from searx.exceptions import SearxEngineCaptchaException
-from searx.locales import region_tag
 from searx.enginelib.traits import EngineTraits
 
 if TYPE_CHECKING:
@@ -136,6 +136,25 @@ safesearch = True
 time_range_dict = {'day': 'd', 'week': 'w', 'month': 'm', 'year': 'y'}
 safesearch_dict = {0: '0', 1: '1', 2: '1'}
 
+cookie_preferences = 'N1N'.join(
+    "%sEEE%s" % x
+    for x in (
+        ('date_time', 'world'),
+        ('disable_family_filter', '%s'),
+        ('disable_open_in_new_window', '0'),
+        ('enable_post_method', '1'),  # hint: POST
+        ('enable_proxy_safety_suggest', '1'),
+        ('enable_stay_control', '1'),
+        ('instant_answers', '1'),
+        ('lang_homepage', 's/device/en/'),
+        ('num_of_results', '10'),
+        ('suggestions', '1'),
+        ('wt_unit', 'celsius'),
+    )
+)
+"""Template of the ``preferences`` cookie, the value of
+``disable_family_filter`` is set per request (see :py:obj:`safesearch_dict`)."""
+
 # search-url
 base_url = 'https://www.startpage.com'
 search_url = base_url + '/sp/search'
@@ -158,12 +177,66 @@ search_form_xpath = '//form[@id="search"]'
     </form>
 """
 
+results_xpath = XPath('//div[@class="w-gl"]/div[contains(@class, "result")]')
+link_xpath = XPath('.//a[contains(@class, "result-title result-link")]')
+title_xpath = XPath('h2')
+content_xpath = XPath('.//p[contains(@class, "description")]')
+
+
+RE_GOOGLE_AD = re.compile(r"^http(s|)://(www\.)?google\.[a-z]+/aclk")
+RE_STARTPAGE_SEARCH = re.compile(r"^http(s|)://(www\.)?startpage\.com/do/search\?")
+
+# date of a search result: "2 Sep 2014 ... " or "5 days ago ... "
+RE_DATE = re.compile(
+    r"^(?:(?P<date>([1-9]|[1-2][0-9]|3[0-1]) [A-Z][a-z]{2} [0-9]{4})|(?P<days>[0-9]+) days? ago) \.\.\. (?P<rest>.*)$",
+    re.S,
+)
+
 # timestamp of the last fetch of 'sc' code
 sc_code_ts = 0
 sc_code = ''
 sc_code_cache_sec = 30
 """Time in seconds the sc-code is cached in memory :py:obj:`get_sc_code`."""
 
+sc_code_lock = threading.Lock()
+"""Lock that serializes the fetch of a new sc-code in :py:obj:`get_sc_code`."""
+
+
+@functools.lru_cache(maxsize=8)
+def get_html_parser(encoding: Optional[str]) -> lxml.html.HTMLParser:
+    """HTML parser for Startpage's pages in the ``encoding`` of the HTTP
+    response (default: UTF-8), the raw ``resp.content`` is parsed without
+    decoding it to a string first.  The IDs of the elements are not needed for
+    a lookup and comments are dropped while parsing."""
+    return lxml.html.HTMLParser(encoding=encoding or 'utf-8', collect_ids=False, remove_comments=True)
+
+
+@functools.lru_cache(maxsize=256)
+def get_engine_locale(searxng_locale: str) -> Tuple[Optional[str], Optional[str], str]:
+    """Get Startpage's region and language for a SearXNG locale and the value
+    of the ``Accept-Language`` header used in :py:obj:`get_sc_code`.
+
+    The values are looked up in the :py:obj:`traits` only once per
+    ``searxng_locale``.
+    """
+    engine_region = traits.get_region(searxng_locale, 'en-US')
+    engine_language = traits.get_language(searxng_locale, 'en')
+
+    if searxng_locale == 'all':
+        searxng_locale = 'en-US'
+    # SearXNG's locale tags are "language" or "language[-script]-territory"
+    tag = searxng_locale.split('-')
+
+    ac_lang = tag[0]
+    if len(tag) > 1:
+        ac_lang = "%s-%s,%s;q=0.9,*;q=0.5" % (
+            tag[0],
+            tag[-1],
+            tag[0],
+        )
+
+    return engine_region, engine_language, ac_lang
+
 
 def get_sc_code(searxng_locale, params):
     """Get an actual ``sc`` argument from Startpage's search form (HTML page).
@@ -175,7 +248,8 @@ def get_sc_code(searxng_locale, params):
 
     Startpage's search form generates a new sc-code on each request.  This
     function scrap a new sc-code from Startpage's home page every
-    :py:obj:`sc_code_cache_sec` seconds.
+    :py:obj:`sc_code_cache_sec` seconds.  Concurrent requests wait for one
+    fetch of a new sc-code (:py:obj:`sc_code_lock`).
 
     """
 
@@ -185,56 +259,50 @@ def get_sc_code(searxng_locale, params):
         logger.debug("get_sc_code: reuse '%s'", sc_code)
         return sc_code
 
-    headers = {**params['headers']}
-    headers['Origin'] = base_url
-    headers['Referer'] = base_url + '/'
-    # headers['Connection'] = 'keep-alive'
-    # headers['Accept-Encoding'] = 'gzip, deflate, br'
-    # headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8'
-    # headers['User-Agent'] = 'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:105.0) Gecko/20100101 Firefox/105.0'
-
-    # add Accept-Language header
-    if searxng_locale == 'all':
-        searxng_locale = 'en-US'
-    locale = babel.Locale.parse(searxng_locale, sep='-')
-
-    if send_accept_language_header:
-        ac_lang = locale.language
-        if locale.territory:
-            ac_lang = "%s-%s,%s;q=0.9,*;q=0.5" % (
-                locale.language,
-                locale.territory,
-                locale.language,
+    with sc_code_lock:
+        # a concurrent request may have fetched a new sc-code in the meantime
+        if sc_code and (time() < (sc_code_ts + sc_code_cache_sec)):
+            return sc_code
+
+        headers = {**params['headers']}
+        headers['Origin'] = base_url
+        headers['Referer'] = base_url + '/'
+        # headers['Connection'] = 'keep-alive'
+        # headers['Accept-Encoding'] = 'gzip, deflate, br'
+        # headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8'
+        # headers['User-Agent'] = 'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:105.0) Gecko/20100101 Firefox/105.0'
+
+        # add Accept-Language header
+        if send_accept_language_header:
+            headers['Accept-Language'] = get_engine_locale(searxng_locale)[2]
+
+        get_sc_url = base_url + '/?sc=%s' % (sc_code)
+        logger.debug("query new sc time-stamp ... %s", get_sc_url)
+        logger.debug("headers: %s", headers)
+        resp = get(get_sc_url, headers=headers)
+
+        # ?? x = network.get('https://www.startpage.com/sp/cdn/images/filter-chevron.svg', headers=headers)
+        # ?? https://www.startpage.com/sp/cdn/images/filter-chevron.svg
+        # ?? ping-back URL: https://www.startpage.com/sp/pb?sc=TLsB0oITjZ8F21
+
+        if str(resp.url).startswith('https://www.startpage.com/sp/captcha'):  # type: ignore
+            raise SearxEngineCaptchaException(
+                message="get_sc_code: got redirected to https://www.startpage.com/sp/captcha",
             )
-        headers['Accept-Language'] = ac_lang
-
-    get_sc_url = base_url + '/?sc=%s' % (sc_code)
-    logger.debug("query new sc time-stamp ... %s", get_sc_url)
-    logger.debug("headers: %s", headers)
-    resp = get(get_sc_url, headers=headers)
-
-    # ?? x = network.get('https://www.startpage.com/sp/cdn/images/filter-chevron.svg', headers=headers)
-    # ?? https://www.startpage.com/sp/cdn/images/filter-chevron.svg
-    # ?? ping-back URL: https://www.startpage.com/sp/pb?sc=TLsB0oITjZ8F21
-
-    if str(resp.url).startswith('https://www.startpage.com/sp/captcha'):  # type: ignore
-        raise SearxEngineCaptchaException(
-            message="get_sc_code: got redirected to https://www.startpage.com/sp/captcha",
-        )
 
-    dom = lxml.html.fromstring(resp.text)  # type: ignore
+        dom = lxml.html.fromstring(resp.content, parser=get_html_parser(resp.encoding))  # type: ignore
 
-    try:
-        sc_code = eval_xpath(dom, search_form_xpath + '//input[@name="sc"]/@value')[0]
-    except IndexError as exc:
-        logger.debug("suspend startpage API --> https://github.com/searxng/searxng/pull/695")
-        raise SearxEngineCaptchaException(
-            message="get_sc_code: [PR-695] query new sc time-stamp failed! (%s)" % resp.url,  # type: ignore
-        ) from exc
+        try:
+            sc_code = eval_xpath(dom, search_form_xpath + '//input[@name="sc"]/@value')[0]
+        except IndexError as exc:
+            logger.debug("suspend startpage API --> https://github.com/searxng/searxng/pull/695")
+            raise SearxEngineCaptchaException(
+                message="get_sc_code: [PR-695] query new sc time-stamp failed! (%s)" % resp.url,  # type: ignore
+            ) from exc
 
-    sc_code_ts = time()
-    logger.debug("get_sc_code: new value is: %s", sc_code)
-    return sc_code
+        sc_code_ts = time()
+        logger.debug("get_sc_code: new value is: %s", sc_code)
+        return sc_code
 
 
 def request(query, params):
@@ -259,8 +327,7 @@ def request(query, params):
 
 def _request_cat_web(query, params):
 
-    engine_region = traits.get_region(params['searxng_locale'], 'en-US')
-    engine_language = traits.get_language(params['searxng_locale'], 'en')
+    engine_region, engine_language, _ = get_engine_locale(params['searxng_locale'])
 
     # build arguments
     args = {
@@ -280,28 +347,15 @@ def _request_cat_web(query, params):
         args['page'] = params['pageno']
 
     # build cookie
-    lang_homepage = 'en'
-    cookie = OrderedDict()
-    cookie['date_time'] = 'world'
-    cookie['disable_family_filter'] = safesearch_dict[params['safesearch']]
-    cookie['disable_open_in_new_window'] = '0'
-    cookie['enable_post_method'] = '1'  # hint: POST
-    cookie['enable_proxy_safety_suggest'] = '1'
-    cookie['enable_stay_control'] = '1'
-    cookie['instant_answers'] = '1'
-    cookie['lang_homepage'] = 's/device/%s/' % lang_homepage
-    cookie['num_of_results'] = '10'
-    cookie['suggestions'] = '1'
-    cookie['wt_unit'] = 'celsius'
+    preferences = cookie_preferences % safesearch_dict[params['safesearch']]
 
     if engine_language:
-        cookie['language'] = engine_language
-        cookie['language_ui'] = engine_language
+        preferences += 'N1NlanguageEEE%sN1Nlanguage_uiEEE%s' % (engine_language, engine_language)
 
     if engine_region:
-        cookie['search_results_region'] = engine_region
+        preferences += 'N1Nsearch_results_regionEEE%s' % engine_region
 
-    params['cookies']['preferences'] = 'N1N'.join(["%sEEE%s" % x for x in cookie.items()])
+    params['cookies']['preferences'] = preferences
     logger.debug('cookie preferences: %s', params['cookies']['preferences'])
 
     # POST request
@@ -319,7 +373,7 @@ def _request_cat_web(query, params):
 
 # get response from search-request
 def response(resp):
-    dom = lxml.html.fromstring(resp.text)
+    dom = lxml.html.fromstring(resp.content, parser=get_html_parser(resp.encoding))
 
     if startpage_categ == 'web':
         return _response_cat_web(dom)
@@ -330,51 +384,45 @@ def response(resp):
 
 def _response_cat_web(dom):
     results = []
+    now = datetime.now()
 
     # parse results
-    for result in eval_xpath(dom, '//div[@class="w-gl"]/div[contains(@class, "result")]'):
-        links = eval_xpath(result, './/a[contains(@class, "result-title result-link")]')
+    for result in eval_xpath(dom, results_xpath):
+        links = eval_xpath(result, link_xpath)
         if not links:
             continue
         link = links[0]
         url = link.attrib.get('href')
 
         # block google-ad url's
-        if re.match(r"^http(s|)://(www\.)?google\.[a-z]+/aclk.*$", url):
+        if RE_GOOGLE_AD.match(url):
             continue
 
         # block startpage search url's
-        if re.match(r"^http(s|)://(www\.)?startpage\.com/do/search\?.*$", url):
+        if RE_STARTPAGE_SEARCH.match(url):
             continue
 
-        title = extract_text(eval_xpath(link, 'h2'))
-        content = eval_xpath(result, './/p[contains(@class, "description")]')
-        content = extract_text(content, allow_none=True) or ''
+        title = extract_text(eval_xpath(link, title_xpath))
+        content = extract_text(eval_xpath(result, content_xpath)) or ''
 
         published_date = None
 
-        # check if search result starts with something like: "2 Sep 2014 ... "
-        if re.match(r"^([1-9]|[1-2][0-9]|3[0-1]) [A-Z][a-z]{2} [0-9]{4} \.\.\. ", content):
-            date_pos = content.find('...') + 4
-            date_string = content[0 : date_pos - 5]
+        date_match = RE_DATE.match(content)
+        if date_match:
             # fix content string
-            content = content[date_pos:]
-
-            try:
-                published_date = dateutil.parser.parse(date_string, dayfirst=True)
-            except ValueError:
-                pass
+            content = date_match.group('rest')
 
-        # check if search result starts with something like: "5 days ago ... "
-        elif re.match(r"^[0-9]+ days? ago \.\.\. ", content):
-            date_pos = content.find('...') + 4
-            date_string = content[0 : date_pos - 5]
+            # check if search result starts with something like: "2 Sep 2014 ... "
+            if date_match.group('date'):
+                try:
+                    published_date = datetime.strptime(date_match.group('date'), "%d %b %Y")
+                except ValueError:
+                    pass
 
-            # calculate datetime
-            published_date = datetime.now() - timedelta(days=int(re.match(r'\d+', date_string).group()))  # type: ignore
-
-            # fix content string
-            content = content[date_pos:]
+            # check if search result starts with something like: "5 days ago ... "
+            else:
+                # calculate datetime
+                published_date = now - timedelta(days=int(date_match.group('days')))
 
         if published_date:
             # append result
@@ -387,6 +435,51 @@ def _response_cat_web(dom):
     return results
 
 
+@functools.lru_cache(maxsize=None)
+def _get_catalog_engine2code() -> Dict[str, str]:
+    """Map (lower case) language names to babel's language codes.  The catalog
+    is built from babel's locale data only once, the returned dictionary must
+    not be modified."""
+
+    catalog_engine2code = {name.lower(): lang_code for lang_code, name in babel.Locale('en').languages.items()}
+
+    # get the native name of every language known by babel
+
+    for lang_code in babel.localedata.locale_identifiers():
+        if '_' in lang_code:
+            continue
+        native_name = babel.Locale(lang_code).get_language_name()
+        if not native_name:
+            print(f"ERROR: language name of startpage's language {lang_code} is unknown by babel")
+            continue
+        native_name = native_name.lower()
+        # add native name exactly as it is
+        catalog_engine2code[native_name] = lang_code
+
+        # add "normalized" language name (i.e. français becomes francais and español becomes espanol)
+        unaccented_name = normalize('NFKD', native_name).encode('ascii', 'ignore').decode('ascii')
+        if len(unaccented_name) == len(normalize('NFC', native_name)):
+            # add only if no letter was dropped (otherwise "normalization" didn't work)
+            catalog_engine2code[unaccented_name] = lang_code
+
+    # values that can't be determined by babel's languages names
+
+    catalog_engine2code.update(
+        {
+            # traditional chinese used in ..
+            'fantizhengwen': 'zh_Hant',
+            # Korean alphabet
+            'hangul': 'ko',
+            # Malayalam is one of 22 scheduled languages of India.
+            'malayam': 'ml',
+            'norsk': 'nb',
+            'sinhalese': 'si',
+        }
+    )
+
+    return catalog_engine2code
+
+
 def fetch_traits(engine_traits: EngineTraits):
     """Fetch :ref:`languages <startpage languages>` and :ref:`regions <startpage
     regions>` from Startpage."""
@@ -401,31 +494,24 @@ def fetch_traits(engine_traits: EngineTraits):
     if not resp.ok:  # type: ignore
         print("ERROR: response from Startpage is not OK.")
 
-    dom = lxml.html.fromstring(resp.text)  # type: ignore
+    dom = lxml.html.fromstring(resp.content, parser=get_html_parser(resp.encoding))  # type: ignore
 
     # regions
 
-    sp_region_names = []
-    for option in dom.xpath('//form[@name="settings"]//select[@name="search_results_region"]/option'):
-        sp_region_names.append(option.get('value'))
+    sp_region_names = [
+        option.get('value')
+        for option in dom.xpath('//form[@name="settings"]//select[@name="search_results_region"]/option')
+    ]
 
     for eng_tag in sp_region_names:
         if eng_tag == 'all':
             continue
         babel_region_tag = {'no_NO': 'nb_NO'}.get(eng_tag, eng_tag)  # norway
 
-        if '-' in babel_region_tag:
-            l, r = babel_region_tag.split('-')
-            r = r.split('_')[-1]
-            sxng_tag = region_tag(babel.Locale.parse(l + '_' + r, sep='_'))
-
-        else:
-            try:
-                sxng_tag = region_tag(babel.Locale.parse(babel_region_tag, sep='_'))
-
-            except babel.UnknownLocaleError:
-                print("ERROR: can't determine babel locale of startpage's locale %s" % eng_tag)
-                continue
+        # the region tag is build from the language and the last subtag:
+        # pt-BR_BR --> pt-BR, en-GB_GB --> en-GB and fil_PH --> fil-PH
+        l, r = babel_region_tag.split('-' if '-' in babel_region_tag else '_', 1)
+        sxng_tag = l + '-' + r.rsplit('_', 1)[-1]
 
         conflict = engine_traits.regions.get(sxng_tag)
         if conflict:
@@ -436,39 +522,7 @@ def fetch_traits(engine_traits: EngineTraits):
 
     # languages
 
-    catalog_engine2code = {name.lower(): lang_code for lang_code, name in babel.Locale('en').languages.items()}
-
-    # get the native name of every language known by babel
-
-    for lang_code in filter(lambda lang_code: lang_code.find('_') == -1, babel.localedata.locale_identifiers()):
-        native_name = babel.Locale(lang_code).get_language_name()
-        if not native_name:
-            print(f"ERROR: language name of startpage's language {lang_code} is unknown by babel")
-            continue
-        native_name = native_name.lower()
-        # add native name exactly as it is
-        catalog_engine2code[native_name] = lang_code
-
-        # add "normalized" language name (i.e. français becomes francais and español becomes espanol)
-        unaccented_name = ''.join(filter(lambda c: not combining(c), normalize('NFKD', native_name)))
-        if len(unaccented_name) == len(unaccented_name.encode()):
-            # add only if result is ascii (otherwise "normalization" didn't work)
-            catalog_engine2code[unaccented_name] = lang_code
-
-    # values that can't be determined by babel's languages names
-
-    catalog_engine2code.update(
-        {
-            # traditional chinese used in ..
-            'fantizhengwen': 'zh_Hant',
-            # Korean alphabet
-            'hangul': 'ko',
-            # Malayalam is one of 22 scheduled languages of India.
-            'malayam': 'ml',
-            'norsk': 'nb',
-            'sinhalese': 'si',
-        }
-    )
+    catalog_engine2code = _get_catalog_engine2code()
 
     skip_eng_tags = {
         'english_uk',  # SearXNG lang 'en' already maps to 'english'
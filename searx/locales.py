@@ -28,6 +28,7 @@ SearXNG’s locale implementations
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 import babel
@@ -166,9 +167,11 @@ def language_tag(locale: babel.Locale) -> str:
     return sxng_lang
 
 
+@functools.lru_cache(maxsize=256)
 def get_locale(locale_tag: str) -> babel.Locale | None:
     """Returns a :py:obj:`babel.Locale` object parsed from argument
-    ``locale_tag``"""
+    ``locale_tag``.  The parsed locales are cached, don't modify the returned
+    object."""
     try:
         locale = babel.Locale.parse(locale_tag, sep='-')
         return locale
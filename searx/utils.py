@@ -55,6 +55,7 @@ _STORAGE_UNIT_VALUE: Dict[str, int] = {
 }
 
 _XPATH_CACHE: Dict[str, XPath] = {}
+_MODULE_CODE_CACHE: Dict[str, types.CodeType] = {}
 _LANG_TO_LC_CACHE: Dict[str, Dict[str, str]] = {}
 
 _FASTTEXT_MODEL: Optional["fasttext.FastText._FastText"] = None  # type: ignore
@@ -434,7 +435,14 @@ def load_module(filename: str, module_dir: str) -> types.ModuleType:
     module = importlib.util.module_from_spec(spec)
     if not spec.loader:
         raise ValueError(f"Error loading '{modpath}' module")
-    spec.loader.exec_module(module)
+    # the same module can be loaded more than one time (e.g. multiple engines
+    # using the same engine module), read and compile the source only once but
+    # execute the code in the namespace of each new module object.
+    code = _MODULE_CODE_CACHE.get(modpath)
+    if code is None:
+        code = spec.loader.get_code(modname)  # type: ignore
+        _MODULE_CODE_CACHE[modpath] = code
+    exec(code, module.__dict__)  # pylint: disable=exec-used
     return module
 
 
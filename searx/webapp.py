@@ -67,7 +67,6 @@ from searx.engines import (
     DEFAULT_CATEGORY,
     categories,
     engines,
-    engine_shortcuts,
 )
 
 from searx import webutils
@@ -1014,7 +1013,6 @@ def preferences():
         ],
         disabled_engines = disabled_engines,
         autocomplete_backends = autocomplete_backends,
-        shortcuts = {y: x for x, y in engine_shortcuts.items()},
         themes = themes,
         plugins = plugins,
         doi_resolvers = settings['doi_resolvers'],
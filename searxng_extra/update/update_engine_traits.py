@@ -14,6 +14,7 @@ the :origin:`CI Update data ... <.github/workflows/data-update.yml>`
 """
 
 # pylint: disable=invalid-name
+from collections import Counter
 from unicodedata import lookup
 from pathlib import Path
 from pprint import pformat
@@ -104,32 +105,18 @@ def filter_locales(traits_map: EngineTraitsMap):
     min_eng_per_region = 15
     min_eng_per_lang = 20
 
-    _ = {}
-    for eng in traits_map.values():
-        for reg in eng.regions.keys():
-            _[reg] = _.get(reg, 0) + 1
+    _ = Counter(reg for eng in traits_map.values() for reg in eng.regions)
 
-    regions = set(k for k, v in _.items() if v >= min_eng_per_region)
-    lang_from_region = set(k.split('-')[0] for k in regions)
+    regions = {k for k, v in _.items() if v >= min_eng_per_region}
+    lang_from_region = {k.split('-')[0] for k in regions}
 
-    _ = {}
-    for eng in traits_map.values():
-        for lang in eng.languages.keys():
-            # ignore script types like zh_Hant, zh_Hans or sr_Latin, pa_Arab (they
-            # already counted by existence of 'zh' or 'sr', 'pa')
-            if '_' in lang:
-                # print("ignore %s" % lang)
-                continue
-            _[lang] = _.get(lang, 0) + 1
+    # ignore script types like zh_Hant, zh_Hans or sr_Latin, pa_Arab (they
+    # already counted by existence of 'zh' or 'sr', 'pa')
+    _ = Counter(lang for eng in traits_map.values() for lang in eng.languages if '_' not in lang)
 
-    languages = set(k for k, v in _.items() if v >= min_eng_per_lang)
+    languages = {k for k, v in _.items() if v >= min_eng_per_lang}
 
-    sxng_tag_list = set()
-    sxng_tag_list.update(regions)
-    sxng_tag_list.update(lang_from_region)
-    sxng_tag_list.update(languages)
-
-    return sxng_tag_list
+    return regions | lang_from_region | languages
 
 
 def write_languages_file(sxng_tag_list):
@@ -22,6 +22,30 @@ class TestEnginesInit(SearxTestCase):  # pylint: disable=missing-class-docstring
         self.assertIn('engine1', engines.engines)
         self.assertIn('engine2', engines.engines)
 
+    def test_engine_default_args_are_copied(self):
+        engine_list = [
+            {'engine': 'dummy', 'name': 'engine1', 'shortcut': 'e1'},
+            {'engine': 'dummy', 'name': 'engine2', 'shortcut': 'e2'},
+        ]
+
+        engines.load_engines(engine_list)
+        engine1, engine2 = engines.engines['engine1'], engines.engines['engine2']
+        self.assertEqual(engine1.tokens, engines.ENGINE_DEFAULT_ARGS['tokens'])
+        self.assertIsNot(engine1.tokens, engines.ENGINE_DEFAULT_ARGS['tokens'])
+        self.assertIsNot(engine1.tokens, engine2.tokens)
+        self.assertIsNot(engine1.categories, engine2.categories)
+
+    def test_initialize_engines_exclude_inactive(self):  # pylint: disable=invalid-name
+        engine_list = [
+            {'engine': 'dummy', 'name': 'engine1', 'shortcut': 'e1'},
+            {'engine': 'not_existing', 'name': 'engine2', 'shortcut': 'e2', 'inactive': True},
+        ]
+
+        engines.load_engines(engine_list)
+        self.assertEqual(len(engines.engines), 1)
+        self.assertIn('engine1', engines.engines)
+        self.assertNotIn('engine2', engines.engines)
+
     def test_initialize_engines_exclude_onions(self):  # pylint: disable=invalid-name
         settings['outgoing']['using_tor_proxy'] = False
         engine_list = [
@@ -78,3 +102,13 @@ class TestEnginesInit(SearxTestCase):  # pylint: disable=missing-class-docstring
             self.assertEqual(
                 cm.output, ['ERROR:searx.engines:The "engine" field is missing for the engine named "engine2"']
             )
+
+    def test_missing_required_attribute(self):
+        settings['outgoing']['using_tor_proxy'] = False
+        engine_list = [
+            {'engine': 'dummy', 'name': 'engine1', 'shortcut': 'e1', 'api_key': None},
+        ]
+        with self.assertLogs('searx.engines', level='ERROR') as cm:  # pylint: disable=invalid-name
+            engines.load_engines(engine_list)
+            self.assertEqual(len(engines.engines), 0)
+            self.assertEqual(cm.output, ['ERROR:searx.engines:Missing engine config attribute: "engine1.api_key"'])
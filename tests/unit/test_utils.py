@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # pylint: disable=missing-module-docstring, invalid-name
 
+from os.path import dirname
+
 import lxml.etree
 from lxml import html
 
@@ -95,6 +97,17 @@ class TestUtils(SearxTestCase):  # pylint: disable=missing-class-docstring
         self.assertEqual(utils.ecma_unescape('text using %xx: %F3'), 'text using %xx: ó')
         self.assertEqual(utils.ecma_unescape('text using %u: %u5409, %u4E16%u754c'), 'text using %u: 吉, 世界')
 
+    def test_load_module(self):
+        engine_dir = dirname(utils.__file__) + '/engines'
+        module_1 = utils.load_module('dummy.py', engine_dir)
+        module_2 = utils.load_module('dummy.py', engine_dir)
+        self.assertIsNot(module_1, module_2)
+        self.assertTrue(callable(module_2.request))
+
+        # each module has its own namespace
+        module_1.about['website'] = 'https://example.org'
+        self.assertIsNone(module_2.about['website'])
+
 
 class TestHTMLTextExtractor(SearxTestCase):  # pylint: disable=missing-class-docstring
     def setUp(self):